@@ -5,67 +5,151 @@ import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import dash
-from dash import dcc, html, Input, Output, callback
+from dash import dcc, html, Input, Output, State, callback
 import dash_bootstrap_components as dbc
 from datetime import datetime, timedelta
+from functools import lru_cache
+from data_cache import get_cache_path, read_cache, write_cache
 
 # ================================================================================================
 # DATA LOADING AND PREPROCESSING FUNCTIONS
 # ================================================================================================
 
-def load_and_clean_data(file_path):
+# Columns read from the CSV (PatientId is never used) and their types, so pandas does not
+# have to infer them and the 0/1 flags do not take 8 bytes per row
+CSV_COLUMNS = ['AppointmentID', 'Gender', 'ScheduledDay', 'AppointmentDay', 'Age', 'Neighbourhood',
+               'Scholarship', 'Hipertension', 'Diabetes', 'Alcoholism', 'Handcap', 'SMS_received',
+               'No-show']
+CSV_DATE_COLUMNS = ['ScheduledDay', 'AppointmentDay']
+CSV_DATE_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+CSV_DTYPES = {
+    'Age': 'int16',
+    'Scholarship': 'uint8',
+    'Hipertension': 'uint8',
+    'Diabetes': 'uint8',
+    'Alcoholism': 'uint8',
+    'Handcap': 'uint8',
+    'SMS_received': 'uint8',
+    'Gender': pd.CategoricalDtype(['F', 'M']),
+    'No-show': pd.CategoricalDtype(['No', 'Yes'])
+}
+
+# Number of CSV rows read and cleaned at a time
+CSV_CHUNK_SIZE = 500_000
+
+# Day names in the order of pandas day numbers (0=Monday, 6=Sunday)
+DAY_NAMES = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+# Medical conditions compared in the medical conditions chart
+MEDICAL_CONDITIONS = ['Hipertension', 'Diabetes', 'Alcoholism', 'Handcap']
+
+# Text columns stored as categories in the cleaned dataset
+CATEGORY_COLUMNS = ['Gender', 'Neighbourhood', 'No-show', 'AgeGroup', 'DayOfWeekName']
+
+# Columns that are only needed while cleaning and are dropped before the result is cached
+UNUSED_COLUMNS = ['ScheduledDay', 'AppointmentDay']
+
+# Bump whenever the cleaning steps change so stale Parquet caches are not reused
+CACHE_VERSION = 6
+
+def clean_chunk(df):
     """
-    Load the medical appointments dataset and perform initial data cleaning.
+    Clean one chunk of raw appointments and derive the features used by the dashboard.
     
     Args:
-        file_path (str): Path to the CSV file containing the medical appointments data
+        df (pandas.DataFrame): Raw rows read from the CSV file
     
     Returns:
-        pandas.DataFrame: Cleaned and preprocessed dataset
+        pandas.DataFrame: Cleaned chunk without the columns listed in UNUSED_COLUMNS
     """
-    # Load the dataset from CSV file
-    df = pd.read_csv(file_path)
-    
-    # Display basic information about the dataset
-    print(f"Dataset shape: {df.shape}")
-    print(f"Columns: {df.columns.tolist()}")
-    
-    # Convert date columns from string to datetime format for better manipulation
-    df['ScheduledDay'] = pd.to_datetime(df['ScheduledDay'])
-    df['AppointmentDay'] = pd.to_datetime(df['AppointmentDay'])
-    
     # Create new features for analysis
     # Calculate the number of days between scheduling and appointment
-    df['DaysWaiting'] = (df['AppointmentDay'] - df['ScheduledDay']).dt.days
+    # Floor-dividing the raw datetime64 difference by one day gives the same result as .dt.days
+    # without creating an intermediate Timedelta series, and int32 is enough for day counts
+    waiting_time = df['AppointmentDay'].values - df['ScheduledDay'].values
+    df['DaysWaiting'] = (waiting_time // np.timedelta64(1, 'D')).astype(np.int32)
+    
+    # Filter rows in a single pass before the remaining features are derived, so they are only
+    # computed for rows that are kept:
+    # - rows with missing values
+    # - rows with negative waiting days (data quality issue)
+    # - rows with unrealistic ages (ages of 120 also fall outside the last age group bin)
+    valid_rows = (
+        df.notna().all(axis=1)
+        & (df['DaysWaiting'] >= 0)
+        & (df['Age'] >= 0) & (df['Age'] < 120)
+    )
+    df = df[valid_rows].copy()
     
     # Extract day of week from appointment date (0=Monday, 6=Sunday)
     df['DayOfWeek'] = df['AppointmentDay'].dt.dayofweek
     
-    # Map day numbers to day names for better visualization
-    day_names = {0: 'Monday', 1: 'Tuesday', 2: 'Wednesday', 3: 'Thursday', 
-                 4: 'Friday', 5: 'Saturday', 6: 'Sunday'}
-    df['DayOfWeekName'] = df['DayOfWeek'].map(day_names)
+    # Use the day numbers directly as codes of an ordered day name category for better visualization
+    df['DayOfWeekName'] = pd.Categorical.from_codes(df['DayOfWeek'].values, categories=DAY_NAMES, ordered=True)
     
     # Create age groups for better analysis
     # Define age bins: 0-17 (Children), 18-35 (Young Adults), 36-55 (Middle-aged), 56+ (Seniors)
-    age_bins = [0, 18, 36, 56, 120]
+    # Ages are already limited to 0-119 above, so only the inner bin edges are needed to find
+    # each age's group code with a binary search
+    age_bins = np.array([18, 36, 56], dtype=np.int16)
     age_labels = ['Children (0-17)', 'Young Adults (18-35)', 'Middle-aged (36-55)', 'Seniors (56+)']
-    df['AgeGroup'] = pd.cut(df['Age'], bins=age_bins, labels=age_labels, right=False, observed=False)
+    age_codes = np.searchsorted(age_bins, df['Age'].values, side='right')
+    df['AgeGroup'] = pd.Categorical.from_codes(age_codes, categories=age_labels, ordered=True)
     
-    # Convert 'No-show' column to binary (1 for No-show, 0 for Show)
-    df['NoShow_Binary'] = (df['No-show'] == 'Yes').astype(int)
+    # Convert 'No-show' column to binary (1 for No-show, 0 for Show), one byte per row
+    df['NoShow_Binary'] = (df['No-show'] == 'Yes').astype('uint8')
     
     # Clean neighborhood names by removing extra spaces and standardizing format
     df['Neighbourhood'] = df['Neighbourhood'].str.strip().str.title()
     
-    # Handle any missing values
-    df = df.dropna()
+    # Drop columns the dashboard does not use
+    return df.drop(columns=UNUSED_COLUMNS)
+
+def load_and_clean_data(file_path):
+    """
+    Load the medical appointments dataset and perform initial data cleaning.
+    The CSV is read and cleaned in chunks of CSV_CHUNK_SIZE rows to limit peak memory,
+    and the cleaned dataset is cached as Parquet, so later runs skip CSV parsing
+    until the CSV file changes.
+    
+    Args:
+        file_path (str): Path to the CSV file containing the medical appointments data
+    
+    Returns:
+        pandas.DataFrame: Cleaned and preprocessed dataset
+    """
+    # Reuse the cleaned dataset from a previous run if the CSV has not changed
+    cache_path = get_cache_path(file_path, CACHE_VERSION)
+    df = read_cache(cache_path)
+    if df is not None:
+        print(f"Loaded cleaned data from cache: {cache_path}")
+        return df
+    
+    # Load the dataset from CSV file chunk by chunk, parsing dates with their known format and
+    # setting column types while reading, so only one raw chunk is held in memory at a time
+    chunks = []
+    total_rows = 0
+    reader = pd.read_csv(file_path, usecols=CSV_COLUMNS, dtype=CSV_DTYPES,
+                         parse_dates=CSV_DATE_COLUMNS, date_format=CSV_DATE_FORMAT,
+                         chunksize=CSV_CHUNK_SIZE)
+    for chunk in reader:
+        total_rows += len(chunk)
+        chunks.append(clean_chunk(chunk))
+    df = pd.concat(chunks)
+    
+    # Store the low-cardinality text columns as categories, so filters and groupbys compare
+    # integer codes instead of Python strings. This is done after concatenating, because each
+    # chunk may contain a different set of values.
+    for column in CATEGORY_COLUMNS:
+        df[column] = df[column].astype('category')
     
-    # Remove any rows with negative waiting days (data quality issue)
-    df = df[df['DaysWaiting'] >= 0]
+    # Display basic information about the dataset
+    print(f"Rows read from CSV: {total_rows}")
+    print(f"Cleaned dataset shape: {df.shape}")
+    print(f"Cleaned dataset columns: {df.columns.tolist()}")
     
-    # Remove any rows with unrealistic ages
-    df = df[(df['Age'] >= 0) & (df['Age'] <= 120)]
+    # Cache the cleaned dataset for the next run
+    write_cache(df, cache_path)
     
     return df
 
@@ -91,10 +175,11 @@ def calculate_summary_statistics(df):
     gender_counts = df['Gender'].value_counts()
     
     # Medical conditions prevalence
+    # Pull all condition flags out once and count each column, instead of indexing the
+    # DataFrame for every condition
     conditions = ['Hipertension', 'Diabetes', 'Alcoholism']
-    condition_stats = {}
-    for condition in conditions:
-        condition_stats[condition] = (df[condition].sum() / len(df)) * 100
+    condition_totals = df[conditions].to_numpy().sum(axis=0)
+    condition_stats = dict(zip(conditions, condition_totals / total_appointments * 100))
     
     return {
         'total_appointments': total_appointments,
@@ -106,26 +191,69 @@ def calculate_summary_statistics(df):
         'condition_stats': condition_stats
     }
 
+def calculate_chart_statistics(df):
+    """
+    Calculate the counts behind the filtered charts (attendance, age group and gender,
+    medical conditions) in one pass of bincount calls over the dataset's arrays, so that
+    the charts are built from a few small arrays instead of each aggregating the rows again.
+    
+    Args:
+        df (pandas.DataFrame): The cleaned dataset or a filtered part of it
+    
+    Returns:
+        dict: Dictionary containing appointment and no-show counts by group
+    """
+    no_shows = df['NoShow_Binary'].values
+    age_groups = df['AgeGroup'].cat.categories
+    genders = df['Gender'].cat.categories
+    
+    # Count appointments and no-shows for every age group and gender combination at once,
+    # using the combined category codes as bin numbers
+    cells = df['AgeGroup'].cat.codes.values.astype(np.intp) * len(genders) + df['Gender'].cat.codes.values
+    shape = (len(age_groups), len(genders))
+    age_gender_counts = np.bincount(cells, minlength=len(age_groups) * len(genders)).reshape(shape)
+    age_gender_no_shows = np.bincount(cells, weights=no_shows, minlength=len(age_groups) * len(genders)).reshape(shape)
+    
+    # Count appointments and no-shows without (0) and with (1) each medical condition
+    # Handcap ranges from 0 to 4, so only the first two bins are kept
+    condition_counts = {}
+    condition_no_shows = {}
+    for condition in MEDICAL_CONDITIONS:
+        values = df[condition].values
+        condition_counts[condition] = np.bincount(values, minlength=2)[:2]
+        condition_no_shows[condition] = np.bincount(values, weights=no_shows, minlength=2)[:2]
+    
+    return {
+        'age_groups': list(age_groups),
+        'genders': list(genders),
+        'age_gender_counts': age_gender_counts,
+        'age_gender_no_shows': age_gender_no_shows,
+        'condition_counts': condition_counts,
+        'condition_no_shows': condition_no_shows
+    }
+
 # ================================================================================================
 # VISUALIZATION FUNCTIONS
 # ================================================================================================
 
-def create_no_show_overview_chart(df):
+def create_no_show_overview_chart(chart_stats):
     """
     Create a pie chart showing the overall no-show vs show-up rates.
     
     Args:
-        df (pandas.DataFrame): The dataset
+        chart_stats (dict): Counts returned by calculate_chart_statistics
     
     Returns:
         plotly.graph_objects.Figure: Pie chart figure
     """
     # Calculate counts for show and no-show
-    show_counts = df['No-show'].value_counts()
+    total_appointments = chart_stats['age_gender_counts'].sum()
+    no_shows = chart_stats['age_gender_no_shows'].sum()
+    show_counts = np.array([total_appointments - no_shows, no_shows])
     
     # Create pie chart with custom colors
     fig = px.pie(
-        values=show_counts.values,
+        values=show_counts,
         names=['Showed Up', 'No Show'],  # Rename for clarity
         title="Overall Appointment Attendance Rate",
         color_discrete_sequence=['#2E8B57', '#DC143C']  # Green for show, Red for no-show
@@ -141,33 +269,36 @@ def create_no_show_overview_chart(df):
     
     return fig
 
-def create_age_gender_analysis(df):
+def create_age_gender_analysis(chart_stats):
     """
     Create a grouped bar chart showing no-show rates by age group and gender.
     
     Args:
-        df (pandas.DataFrame): The dataset
+        chart_stats (dict): Counts returned by calculate_chart_statistics
     
     Returns:
         plotly.graph_objects.Figure: Grouped bar chart figure
     """
+    age_groups = np.array(chart_stats['age_groups'])
+    counts = chart_stats['age_gender_counts']
+    
     # Calculate no-show rates by age group and gender
-    age_gender_stats = df.groupby(['AgeGroup', 'Gender'])['NoShow_Binary'].agg(['count', 'sum']).reset_index()
-    age_gender_stats['NoShowRate'] = (age_gender_stats['sum'] / age_gender_stats['count']) * 100
+    with np.errstate(divide='ignore', invalid='ignore'):
+        no_show_rates = chart_stats['age_gender_no_shows'] / counts * 100
     
-    # Create grouped bar chart
-    fig = px.bar(
-        age_gender_stats,
-        x='AgeGroup',
-        y='NoShowRate',
-        color='Gender',
-        title='No-Show Rate by Age Group and Gender',
-        labels={'NoShowRate': 'No-Show Rate (%)', 'AgeGroup': 'Age Group'},
-        color_discrete_sequence=['#FF6B6B', '#4ECDC4']
-    )
+    # Create grouped bar chart with one trace per gender, leaving out combinations without appointments
+    fig = go.Figure()
+    for i, (gender, color) in enumerate(zip(chart_stats['genders'], ['#FF6B6B', '#4ECDC4'])):
+        present = counts[:, i] > 0
+        if present.any():
+            fig.add_trace(go.Bar(x=age_groups[present], y=no_show_rates[present, i],
+                                 name=gender, marker_color=color))
     
     # Update layout
+    fig.update_xaxes(categoryorder='array', categoryarray=chart_stats['age_groups'])
     fig.update_layout(
+        title_text='No-Show Rate by Age Group and Gender',
+        barmode='group',
         xaxis_title="Age Group",
         yaxis_title="No-Show Rate (%)",
         font=dict(size=12),
@@ -188,33 +319,30 @@ def create_day_of_week_analysis(df):
         plotly.graph_objects.Figure: Bar chart with secondary y-axis
     """
     # Calculate statistics by day of week
-    day_stats = df.groupby('DayOfWeekName').agg({
-        'AppointmentID': 'count',
-        'NoShow_Binary': ['sum', 'mean']
-    }).reset_index()
+    # DayOfWeek is already a 0-6 integer, so counts and no-show sums are two bincount passes
+    day_numbers = df['DayOfWeek'].values
+    total_appointments = np.bincount(day_numbers, minlength=len(DAY_NAMES))
+    no_shows = np.bincount(day_numbers, weights=df['NoShow_Binary'].values, minlength=len(DAY_NAMES))
     
-    # Flatten column names
-    day_stats.columns = ['DayOfWeek', 'TotalAppointments', 'NoShows', 'NoShowRate']
-    day_stats['NoShowRate'] = day_stats['NoShowRate'] * 100
-    
-    # Define the order of days for proper display
-    day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-    day_stats['DayOfWeek'] = pd.Categorical(day_stats['DayOfWeek'], categories=day_order, ordered=True)
-    day_stats = day_stats.sort_values('DayOfWeek')
+    # Only show days that have appointments
+    has_appointments = total_appointments > 0
+    days = np.array(DAY_NAMES)[has_appointments]
+    total_appointments = total_appointments[has_appointments]
+    no_show_rate = no_shows[has_appointments] / total_appointments * 100
     
     # Create subplot with secondary y-axis
     fig = make_subplots(specs=[[{"secondary_y": True}]])
     
     # Add bar chart for total appointments
     fig.add_trace(
-        go.Bar(x=day_stats['DayOfWeek'], y=day_stats['TotalAppointments'],
+        go.Bar(x=days, y=total_appointments,
                name='Total Appointments', marker_color='lightblue'),
         secondary_y=False,
     )
     
     # Add line chart for no-show rate
     fig.add_trace(
-        go.Scatter(x=day_stats['DayOfWeek'], y=day_stats['NoShowRate'],
+        go.Scatter(x=days, y=no_show_rate,
                    mode='lines+markers', name='No-Show Rate (%)',
                    line=dict(color='red', width=3), marker=dict(size=8)),
         secondary_y=True,
@@ -228,85 +356,94 @@ def create_day_of_week_analysis(df):
     
     return fig
 
-def create_waiting_time_analysis(df):
+def create_waiting_time_analysis(df, max_days=None):
     """
     Create a histogram showing the relationship between waiting time and no-show rate.
     
     Args:
         df (pandas.DataFrame): The dataset
+        max_days (int): Largest waiting time to include, defaults to the 95th percentile of the dataset
     
     Returns:
         plotly.graph_objects.Figure: Histogram figure
     """
+    days = df['DaysWaiting'].values
+    no_shows = df['NoShow_Binary'].values.astype(bool)
+    
     # Filter out extreme waiting times for better visualization (keep 95% of data)
-    waiting_time_95th = df['DaysWaiting'].quantile(0.95)
-    df_filtered = df[df['DaysWaiting'] <= waiting_time_95th]
-    
-    # Create histogram with different colors for show vs no-show
-    fig = px.histogram(
-        df_filtered,
-        x='DaysWaiting',
-        color='No-show',
-        title='Distribution of Waiting Time by Attendance',
-        labels={'DaysWaiting': 'Days Between Scheduling and Appointment', 'count': 'Number of Appointments'},
-        nbins=30,
-        color_discrete_sequence=['#2E8B57', '#DC143C']
-    )
+    if max_days is None:
+        max_days = int(np.percentile(days, 95)) if len(days) > 0 else 0
+    kept = days <= max_days
+    days = days[kept]
+    no_shows = no_shows[kept]
+    
+    # Count appointments in up to 30 equally sized bins of whole days for each attendance group,
+    # so only the bin counts are sent to the browser rather than every appointment
+    bin_size = int(np.ceil((max_days + 1) / 30))
+    bin_edges = np.arange(0, max_days + bin_size + 1, bin_size)
+    bin_centers = bin_edges[:-1] + (bin_size - 1) / 2
+    show_counts, _ = np.histogram(days[~no_shows], bins=bin_edges)
+    no_show_counts, _ = np.histogram(days[no_shows], bins=bin_edges)
+    
+    # Create stacked histogram with different colors for show vs no-show
+    fig = go.Figure([
+        go.Bar(x=bin_centers, y=show_counts, width=bin_size, name='No', marker_color='#2E8B57'),
+        go.Bar(x=bin_centers, y=no_show_counts, width=bin_size, name='Yes', marker_color='#DC143C')
+    ])
     
     # Update layout
     fig.update_layout(
+        title_text='Distribution of Waiting Time by Attendance',
+        barmode='stack',
         xaxis_title="Days Waiting",
         yaxis_title="Number of Appointments",
         font=dict(size=12),
         title_font=dict(size=16, family="Arial Black"),
+        legend=dict(title="No-show"),
         bargap=0.1
     )
     
     return fig
 
-def create_medical_conditions_analysis(df):
+def create_medical_conditions_analysis(chart_stats):
     """
     Create a grouped bar chart showing no-show rates for different medical conditions.
     
     Args:
-        df (pandas.DataFrame): The dataset
+        chart_stats (dict): Counts returned by calculate_chart_statistics
     
     Returns:
         plotly.graph_objects.Figure: Grouped bar chart figure
     """
     # List of medical conditions to analyze
-    conditions = ['Hipertension', 'Diabetes', 'Alcoholism', 'Handcap']
+    conditions = MEDICAL_CONDITIONS
     
-    condition_stats = []
+    # No-show rates (%) for patients with and without each condition
+    with_condition_rates = []
+    without_condition_rates = []
     
     # Calculate no-show rates for each condition
     for condition in conditions:
-        # Patients with the condition
-        with_condition = df[df[condition] == 1]['NoShow_Binary'].mean() * 100
-        # Patients without the condition
-        without_condition = df[df[condition] == 0]['NoShow_Binary'].mean() * 100
+        counts = chart_stats['condition_counts'][condition]
+        no_shows = chart_stats['condition_no_shows'][condition]
         
-        condition_stats.extend([
-            {'Condition': condition, 'Group': 'With Condition', 'NoShowRate': with_condition},
-            {'Condition': condition, 'Group': 'Without Condition', 'NoShowRate': without_condition}
-        ])
-    
-    condition_df = pd.DataFrame(condition_stats)
-    
-    # Create grouped bar chart
-    fig = px.bar(
-        condition_df,
-        x='Condition',
-        y='NoShowRate',
-        color='Group',
-        title='No-Show Rates by Medical Conditions',
-        labels={'NoShowRate': 'No-Show Rate (%)', 'Condition': 'Medical Condition'},
-        color_discrete_sequence=['#FF6B6B', '#4ECDC4'],
-        barmode='group'
-    )
+        # Empty groups give NaN, the same as the mean of an empty selection
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # Patients with the condition
+            with_condition_rates.append(no_shows[1] / counts[1] * 100)
+            # Patients without the condition
+            without_condition_rates.append(no_shows[0] / counts[0] * 100)
+    
+    # Create grouped bar chart directly from the rates
+    fig = go.Figure([
+        go.Bar(x=conditions, y=with_condition_rates, name='With Condition', marker_color='#FF6B6B'),
+        go.Bar(x=conditions, y=without_condition_rates, name='Without Condition', marker_color='#4ECDC4')
+    ])
     
     # Update layout
     fig.update_layout(
+        title_text='No-Show Rates by Medical Conditions',
+        barmode='group',
         xaxis_title="Medical Condition",
         yaxis_title="No-Show Rate (%)",
         font=dict(size=12),
@@ -328,7 +465,7 @@ def create_neighborhood_analysis(df, top_n=15):
         plotly.graph_objects.Figure: Bar chart figure
     """
     # Calculate statistics by neighborhood
-    neighborhood_stats = df.groupby('Neighbourhood').agg({
+    neighborhood_stats = df.groupby('Neighbourhood', observed=True, sort=False).agg({
         'AppointmentID': 'count',
         'NoShow_Binary': 'mean'
     }).reset_index()
@@ -418,6 +555,18 @@ def create_sms_scholarship_analysis(df):
 print("Loading and preprocessing data...")
 df = load_and_clean_data('medical_appointments.csv')
 stats = calculate_summary_statistics(df)
+
+# 95th percentile of the waiting days, used as the upper bound of the waiting days slider
+DW95 = int(df['DaysWaiting'].quantile(0.95))
+
+# Counts behind the filtered charts for the full dataset, used for their initial figures
+overall_chart_stats = calculate_chart_statistics(df)
+
+# Charts that are not updated by the filters only depend on the full dataset,
+# so they are built once here and reused by the layout
+day_of_week_fig = create_day_of_week_analysis(df)
+sms_scholarship_fig = create_sms_scholarship_analysis(df)
+neighborhood_fig = create_neighborhood_analysis(df)
 print("Data preprocessing completed!")
 
 # Initialize the Dash application with Bootstrap theme for better styling
@@ -528,14 +677,14 @@ app.layout = dbc.Container([
                             dcc.Slider(
                                 id='waiting-days-slider',
                                 min=0,
-                                max=int(df['DaysWaiting'].quantile(0.95)),
+                                max=DW95,
                                 step=1,
-                                value=int(df['DaysWaiting'].quantile(0.95)),
+                                value=DW95,
                                 marks={
                                     0: '0',
                                     7: '1 week',
                                     30: '1 month',
-                                    int(df['DaysWaiting'].quantile(0.95)): f"{int(df['DaysWaiting'].quantile(0.95))} days"
+                                    DW95: f"{DW95} days"
                                 },
                                 tooltip={"placement": "bottom", "always_visible": True}
                             )
@@ -552,7 +701,7 @@ app.layout = dbc.Container([
         dbc.Col([
             dcc.Graph(
                 id='no-show-overview',
-                figure=create_no_show_overview_chart(df)
+                figure=create_no_show_overview_chart(overall_chart_stats)
             )
         ], width=6),
         
@@ -560,7 +709,7 @@ app.layout = dbc.Container([
         dbc.Col([
             dcc.Graph(
                 id='age-gender-analysis',
-                figure=create_age_gender_analysis(df)
+                figure=create_age_gender_analysis(overall_chart_stats)
             )
         ], width=6)
     ], className="mb-4"),
@@ -570,7 +719,7 @@ app.layout = dbc.Container([
         dbc.Col([
             dcc.Graph(
                 id='day-of-week-analysis',
-                figure=create_day_of_week_analysis(df)
+                figure=day_of_week_fig
             )
         ], width=12)
     ], className="mb-4"),
@@ -590,14 +739,14 @@ app.layout = dbc.Container([
         dbc.Col([
             dcc.Graph(
                 id='medical-conditions-analysis',
-                figure=create_medical_conditions_analysis(df)
+                figure=create_medical_conditions_analysis(overall_chart_stats)
             )
         ], width=6),
         
         dbc.Col([
             dcc.Graph(
                 id='sms-scholarship-analysis',
-                figure=create_sms_scholarship_analysis(df)
+                figure=sms_scholarship_fig
             )
         ], width=6)
     ], className="mb-4"),
@@ -607,7 +756,7 @@ app.layout = dbc.Container([
         dbc.Col([
             dcc.Graph(
                 id='neighborhood-analysis',
-                figure=create_neighborhood_analysis(df)
+                figure=neighborhood_fig
             )
         ], width=12)
     ], className="mb-4"),
@@ -626,50 +775,207 @@ app.layout = dbc.Container([
 # INTERACTIVE CALLBACKS
 # ================================================================================================
 
-@app.callback(
-    [Output('no-show-overview', 'figure'),
-     Output('age-gender-analysis', 'figure'),
-     Output('waiting-time-analysis', 'figure'),
-     Output('medical-conditions-analysis', 'figure')],
-    [Input('age-group-filter', 'value'),
-     Input('gender-filter', 'value'),
-     Input('waiting-days-slider', 'value')]
-)
-def update_charts(age_group, gender, max_waiting_days):
+class DataArrays:
+    """
+    NumPy arrays of the columns used by the filters, extracted once from the cleaned dataset
+    so that filter masks are built on plain contiguous arrays instead of pandas Series.
+    Category columns are stored as their integer codes.
     """
-    Update charts based on filter selections.
-    This callback function responds to changes in the filter controls and updates
-    the visualizations accordingly.
+    age_group = df['AgeGroup'].cat.codes.to_numpy()
+    gender = df['Gender'].cat.codes.to_numpy()
+    days_waiting = df['DaysWaiting'].to_numpy()
+
+@lru_cache(maxsize=16)
+def get_group_positions(age_group, gender):
+    """
+    Get the row positions matching an age group and gender selection.
+    There are only 15 possible combinations, so each selection is computed once and
+    reused, leaving only the waiting days filter to be applied on each update.
     
     Args:
         age_group (str): Selected age group filter value
         gender (str): Selected gender filter value
-        max_waiting_days (int): Maximum waiting days from slider
     
     Returns:
-        tuple: Updated figures for the charts
+        numpy.ndarray: Positions of the matching rows in the cleaned dataset
     """
-    # Start with the full dataset
-    filtered_df = df.copy()
+    # Build a single boolean mask by comparing category codes
+    mask = np.ones(len(df), dtype=bool)
     
     # Apply age group filter
     if age_group != 'all':
-        filtered_df = filtered_df[filtered_df['AgeGroup'] == age_group]
+        np.bitwise_and(mask, DataArrays.age_group == df['AgeGroup'].cat.categories.get_loc(age_group), out=mask)
     
     # Apply gender filter
     if gender != 'all':
-        filtered_df = filtered_df[filtered_df['Gender'] == gender]
+        np.bitwise_and(mask, DataArrays.gender == df['Gender'].cat.categories.get_loc(gender), out=mask)
+    
+    return np.flatnonzero(mask)
+
+def get_filtered_data(age_group, gender, max_waiting_days):
+    """
+    Get the rows matching all filter selections.
+    
+    Args:
+        age_group (str): Selected age group filter value
+        gender (str): Selected gender filter value
+        max_waiting_days (int): Maximum waiting days from slider
+    
+    Returns:
+        pandas.DataFrame: Rows matching the filter selections
+    """
+    # Start with the cached positions for the selected age group and gender
+    positions = get_group_positions(age_group, gender)
+    
+    # Apply waiting days filter and select the matching rows once
+    positions = positions[DataArrays.days_waiting[positions] <= max_waiting_days]
+    return df.iloc[positions]
+
+@lru_cache(maxsize=1024)
+def get_filtered_statistics(age_group, gender, max_waiting_days):
+    """
+    Calculate the chart counts for the rows matching the filter selections.
+    The counts are cached by filter values, so the chart callbacks for the same selection
+    filter and aggregate the rows only once between them.
+    The returned dictionary is shared between calls and must not be modified.
+    
+    Args:
+        age_group (str): Selected age group filter value
+        gender (str): Selected gender filter value
+        max_waiting_days (int): Maximum waiting days from slider
+    
+    Returns:
+        dict: Counts returned by calculate_chart_statistics for the filtered rows
+    """
+    return calculate_chart_statistics(get_filtered_data(age_group, gender, max_waiting_days))
+
+@lru_cache(maxsize=1024)
+def get_filtered_chart(create_chart, age_group, gender, max_waiting_days):
+    """
+    Create a chart for the rows matching the filter selections.
+    Charts are cached by chart function and filter values, so returning to a previous
+    selection reuses the figure instead of building it again.
+    The returned figure is shared between calls and must not be modified.
+    
+    Args:
+        create_chart (function): Chart function called with the chart counts of the filtered rows
+        age_group (str): Selected age group filter value
+        gender (str): Selected gender filter value
+        max_waiting_days (int): Maximum waiting days from slider
     
-    # Apply waiting days filter
-    filtered_df = filtered_df[filtered_df['DaysWaiting'] <= max_waiting_days]
+    Returns:
+        plotly.graph_objects.Figure: Chart figure for the filtered data
+    """
+    return create_chart(get_filtered_statistics(age_group, gender, max_waiting_days))
+
+# Filter controls shared by the chart callbacks. Each chart has its own callback, so Dash
+# requests and updates the charts independently instead of waiting for all four figures.
+FILTER_INPUTS = [Input('age-group-filter', 'value'),
+                 Input('gender-filter', 'value'),
+                 Input('waiting-days-slider', 'value')]
+
+@app.callback(Output('no-show-overview', 'figure'), FILTER_INPUTS)
+def update_no_show_overview(age_group, gender, max_waiting_days):
+    """
+    Update the overall attendance pie chart based on filter selections.
+    
+    Args:
+        age_group (str): Selected age group filter value
+        gender (str): Selected gender filter value
+        max_waiting_days (int): Maximum waiting days from slider
     
-    # Update charts with filtered data
-    no_show_fig = create_no_show_overview_chart(filtered_df)
-    age_gender_fig = create_age_gender_analysis(filtered_df)
-    waiting_time_fig = create_waiting_time_analysis(filtered_df)
-    medical_conditions_fig = create_medical_conditions_analysis(filtered_df)
+    Returns:
+        plotly.graph_objects.Figure: Updated chart figure
+    """
+    return get_filtered_chart(create_no_show_overview_chart, age_group, gender, max_waiting_days)
+
+@app.callback(Output('age-gender-analysis', 'figure'), FILTER_INPUTS)
+def update_age_gender_analysis(age_group, gender, max_waiting_days):
+    """
+    Update the age group and gender chart based on filter selections.
+    
+    Args:
+        age_group (str): Selected age group filter value
+        gender (str): Selected gender filter value
+        max_waiting_days (int): Maximum waiting days from slider
     
-    return no_show_fig, age_gender_fig, waiting_time_fig, medical_conditions_fig
+    Returns:
+        plotly.graph_objects.Figure: Updated chart figure
+    """
+    return get_filtered_chart(create_age_gender_analysis, age_group, gender, max_waiting_days)
+
+@lru_cache(maxsize=16)
+def get_waiting_time_chart(age_group, gender):
+    """
+    Create the waiting time distribution chart for an age group and gender selection.
+    The histogram always covers 0 to DW95 days, so it is computed once per selection and
+    the waiting days slider only has to change the visible x axis range.
+    The returned figure is shared between calls and must not be modified.
+    
+    Args:
+        age_group (str): Selected age group filter value
+        gender (str): Selected gender filter value
+    
+    Returns:
+        plotly.graph_objects.Figure: Histogram figure
+    """
+    return create_waiting_time_analysis(df.iloc[get_group_positions(age_group, gender)], max_days=DW95)
+
+@app.callback(Output('waiting-time-analysis', 'figure'),
+              [Input('age-group-filter', 'value'),
+               Input('gender-filter', 'value')],
+              [State('waiting-days-slider', 'value')])
+def update_waiting_time_analysis(age_group, gender, max_waiting_days):
+    """
+    Update the waiting time distribution chart based on the age group and gender selections.
+    Slider changes are handled in the browser by the clientside callback below.
+    
+    Args:
+        age_group (str): Selected age group filter value
+        gender (str): Selected gender filter value
+        max_waiting_days (int): Maximum waiting days from slider
+    
+    Returns:
+        plotly.graph_objects.Figure: Updated chart figure
+    """
+    # Copy the cached figure before limiting its x axis to the current slider value
+    fig = go.Figure(get_waiting_time_chart(age_group, gender))
+    fig.update_xaxes(range=[-0.5, max_waiting_days + 0.5])
+    return fig
+
+# Moving the waiting days slider only changes the visible range of the waiting time chart,
+# so it is done in the browser without a request to the server
+app.clientside_callback(
+    """
+    function(maxWaitingDays, figure) {
+        if (!figure) {
+            return window.dash_clientside.no_update;
+        }
+        const xaxis = Object.assign({}, figure.layout.xaxis, {range: [-0.5, maxWaitingDays + 0.5], autorange: false});
+        const layout = Object.assign({}, figure.layout, {xaxis: xaxis});
+        return Object.assign({}, figure, {layout: layout});
+    }
+    """,
+    Output('waiting-time-analysis', 'figure', allow_duplicate=True),
+    [Input('waiting-days-slider', 'value')],
+    [State('waiting-time-analysis', 'figure')],
+    prevent_initial_call=True
+)
+
+@app.callback(Output('medical-conditions-analysis', 'figure'), FILTER_INPUTS)
+def update_medical_conditions_analysis(age_group, gender, max_waiting_days):
+    """
+    Update the medical conditions chart based on filter selections.
+    
+    Args:
+        age_group (str): Selected age group filter value
+        gender (str): Selected gender filter value
+        max_waiting_days (int): Maximum waiting days from slider
+    
+    Returns:
+        plotly.graph_objects.Figure: Updated chart figure
+    """
+    return get_filtered_chart(create_medical_conditions_analysis, age_group, gender, max_waiting_days)
 
 # ================================================================================================
 # APPLICATION ENTRY POINT
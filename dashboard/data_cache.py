@@ -0,0 +1,69 @@
+"""
+Parquet cache for preprocessed copies of the medical appointments dataset, shared by the
+dashboard and the demo script.
+"""
+
+import os
+import tempfile
+import pandas as pd
+
+def get_cache_path(file_path, version, prefix=''):
+    """
+    Build the Parquet cache path for a CSV file, keyed by its modification time, size
+    and the cache version.
+    
+    Args:
+        file_path (str): Path to the CSV file containing the medical appointments data
+        version (int): Version of the preprocessing that produced the cached dataset
+        prefix (str): Prefix that keeps the caches of different scripts apart
+    
+    Returns:
+        str: Path of the cached Parquet file inside a 'cache' folder next to the CSV
+    """
+    key = f"{os.path.getmtime(file_path)}_{os.path.getsize(file_path)}_v{version}"
+    cache_dir = os.path.join(os.path.dirname(os.path.abspath(file_path)), 'cache')
+    return os.path.join(cache_dir, f"{prefix}{key}.parquet")
+
+def read_cache(cache_path):
+    """
+    Read a cached dataset, if there is a usable one.
+    
+    Args:
+        cache_path (str): Path of the cached Parquet file
+    
+    Returns:
+        pandas.DataFrame or None: Cached dataset, or None if it is missing or unreadable
+    """
+    if not os.path.exists(cache_path):
+        return None
+    try:
+        return pd.read_parquet(cache_path)
+    except (ImportError, OSError, ValueError) as e:
+        print(f"Could not read the Parquet cache, reading the CSV instead: {e}")
+        return None
+
+def write_cache(df, cache_path, compression='zstd'):
+    """
+    Write a dataset to the Parquet cache. The file is written under a temporary name and
+    then renamed, so an interrupted run never leaves a truncated cache behind. Failing to
+    write the cache is not an error, the dataset is just parsed again on the next run.
+    
+    Args:
+        df (pandas.DataFrame): Dataset to cache
+        cache_path (str): Path of the cached Parquet file
+        compression (str): Parquet compression codec
+    """
+    tmp_path = None
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(suffix='.tmp', dir=os.path.dirname(cache_path))
+        os.close(fd)
+        df.to_parquet(tmp_path, compression=compression)
+        os.replace(tmp_path, cache_path)
+    except ImportError:
+        print("pyarrow is not installed, skipping the Parquet cache")
+    except OSError as e:
+        print(f"Could not write the Parquet cache, skipping it: {e}")
+    finally:
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
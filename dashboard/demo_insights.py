@@ -4,9 +4,96 @@ Demo script to showcase key insights from the Medical Appointments dataset.
 This script runs a quick analysis and displays interesting findings.
 """
 
+import io
+import sys
 import pandas as pd
 import numpy as np
 from datetime import datetime
+from data_cache import get_cache_path, read_cache, write_cache
+
+# Columns used by the analysis and their types, so pandas does not have to infer them
+# and unused columns are never loaded
+USECOLS = ['PatientId', 'Gender', 'ScheduledDay', 'AppointmentDay', 'Age', 'Neighbourhood',
+           'Scholarship', 'Hipertension', 'Diabetes', 'Alcoholism', 'SMS_received', 'No-show']
+DTYPES = {
+    'Scholarship': 'int8',
+    'Hipertension': 'int8',
+    'Diabetes': 'int8',
+    'Alcoholism': 'int8',
+    'SMS_received': 'int8',
+    'Age': 'int16',
+    'Gender': 'category',
+    'Neighbourhood': 'category',
+    'No-show': 'category'
+}
+
+# Date columns are parsed while reading with their known format instead of inferring it per value
+DATE_COLUMNS = ['ScheduledDay', 'AppointmentDay']
+DATE_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+
+# Bump whenever the preprocessing changes so stale Parquet caches are not reused
+CACHE_VERSION = 3
+
+# Raw columns that are only used to derive DaysWaiting and NoShow_Binary
+PREPROCESSED_COLUMNS = ['ScheduledDay', 'No-show']
+
+def load_appointments(file_path):
+    """
+    Load and preprocess the medical appointments dataset.
+    The preprocessed dataset is cached as Parquet in a 'cache' folder next to the CSV,
+    keyed by the CSV's modification time and size, so repeated runs skip CSV parsing.
+    
+    Args:
+        file_path (str): Path to the CSV file containing the medical appointments data
+    
+    Returns:
+        pandas.DataFrame: Preprocessed dataset
+    """
+    cache_path = get_cache_path(file_path, CACHE_VERSION, prefix='demo_')
+    df = read_cache(cache_path)
+    if df is not None:
+        return df
+    
+    read_options = dict(usecols=USECOLS, dtype=DTYPES, parse_dates=DATE_COLUMNS, date_format=DATE_FORMAT)
+    try:
+        # pyarrow's CSV reader tokenizes and converts columns on multiple threads
+        df = pd.read_csv(file_path, engine='pyarrow', **read_options)
+    except ImportError:
+        # The C engine can read the local file through mmap instead of buffered reads
+        df = pd.read_csv(file_path, memory_map=True, **read_options)
+    
+    # Basic preprocessing
+    # Floor-divide the raw datetime64 difference by one day, which matches .dt.days without
+    # creating an intermediate Timedelta series
+    waiting_time = df['AppointmentDay'].to_numpy() - df['ScheduledDay'].to_numpy()
+    df['DaysWaiting'] = (waiting_time // np.timedelta64(1, 'D')).astype('int32')
+    # Kept as bool (1 byte per row), which sums and averages the same as 0/1 integers
+    df['NoShow_Binary'] = df['No-show'] == 'Yes'
+    # The analysis only needs the derived columns, so the raw ones are not kept or cached
+    df = df.drop(columns=PREPROCESSED_COLUMNS)
+    
+    write_cache(df, cache_path, compression='snappy')
+    
+    return df
+
+def group_no_show_rates(keys, no_shows):
+    """
+    Count appointments and calculate the no-show rate for each group of appointments.
+    Groups are numbered with pd.factorize and aggregated with np.bincount, which avoids
+    building a pandas GroupBy object for every breakdown.
+    
+    Args:
+        keys (pandas.Series): Group key of each appointment, missing keys are ignored
+        no_shows (numpy.ndarray): 1 for each no-show appointment, 0 otherwise
+    
+    Returns:
+        tuple: Sorted group keys, appointment counts and no-show rates (0-1) per group
+    """
+    codes, groups = pd.factorize(keys, sort=True)
+    valid = codes >= 0
+    counts = np.bincount(codes[valid], minlength=len(groups))
+    rates = np.bincount(codes[valid], weights=no_shows[valid], minlength=len(groups)) / counts
+    return groups, counts, rates
 
 def analyze_medical_appointments():
     """
@@ -17,105 +104,128 @@ def analyze_medical_appointments():
     
     # Load the dataset
     print("📊 Loading dataset...")
-    df = pd.read_csv('medical_appointments.csv')
+    df = load_appointments('medical_appointments.csv')
     
-    # Basic preprocessing
-    df['ScheduledDay'] = pd.to_datetime(df['ScheduledDay'])
-    df['AppointmentDay'] = pd.to_datetime(df['AppointmentDay'])
-    df['DaysWaiting'] = (df['AppointmentDay'] - df['ScheduledDay']).dt.days
-    df['NoShow_Binary'] = (df['No-show'] == 'Yes').astype(int)
+    # The report is collected in memory and written to stdout in one call at the end
+    report = io.StringIO()
+    
+    # Row count, no-show flags (as floats) and waiting days shared by every statistic below
+    n = len(df)
+    no_shows = df['NoShow_Binary'].to_numpy(dtype=np.float64)
+    days_waiting = df['DaysWaiting'].to_numpy()
     
     # Dataset overview
-    print(f"\n📈 Dataset Overview:")
-    print(f"   • Total appointments: {len(df):,}")
-    print(f"   • Date range: {df['AppointmentDay'].min().strftime('%Y-%m-%d')} to {df['AppointmentDay'].max().strftime('%Y-%m-%d')}")
-    print(f"   • Unique patients: {df['PatientId'].nunique():,}")
-    print(f"   • Unique neighborhoods: {df['Neighbourhood'].nunique()}")
+    print(f"\n📈 Dataset Overview:", file=report)
+    print(f"   • Total appointments: {n:,}", file=report)
+    print(f"   • Date range: {df['AppointmentDay'].min().strftime('%Y-%m-%d')} to {df['AppointmentDay'].max().strftime('%Y-%m-%d')}", file=report)
+    print(f"   • Unique patients: {df['PatientId'].nunique():,}", file=report)
+    print(f"   • Unique neighborhoods: {df['Neighbourhood'].nunique()}", file=report)
     
     # Key statistics
-    no_show_rate = (df['NoShow_Binary'].sum() / len(df)) * 100
+    no_show_rate = no_shows.mean() * 100
     show_rate = 100 - no_show_rate
     avg_age = df['Age'].mean()
-    avg_waiting = df['DaysWaiting'].mean()
+    avg_waiting = days_waiting.mean()
     
-    print(f"\n🎯 Key Statistics:")
-    print(f"   • Show-up rate: {show_rate:.1f}%")
-    print(f"   • No-show rate: {no_show_rate:.1f}%")
-    print(f"   • Average patient age: {avg_age:.1f} years")
-    print(f"   • Average waiting time: {avg_waiting:.1f} days")
+    print(f"\n🎯 Key Statistics:", file=report)
+    print(f"   • Show-up rate: {show_rate:.1f}%", file=report)
+    print(f"   • No-show rate: {no_show_rate:.1f}%", file=report)
+    print(f"   • Average patient age: {avg_age:.1f} years", file=report)
+    print(f"   • Average waiting time: {avg_waiting:.1f} days", file=report)
     
     # Gender analysis
-    gender_stats = df.groupby('Gender')['NoShow_Binary'].agg(['count', 'mean']).round(3)
-    print(f"\n👥 Gender Analysis:")
-    for gender in ['F', 'M']:
-        if gender in gender_stats.index:
-            count = gender_stats.loc[gender, 'count']
-            rate = gender_stats.loc[gender, 'mean'] * 100
-            gender_name = 'Female' if gender == 'F' else 'Male'
-            print(f"   • {gender_name}: {count:,} appointments, {rate:.1f}% no-show rate")
+    genders, gender_counts, gender_rates = group_no_show_rates(df['Gender'], no_shows)
+    print(f"\n👥 Gender Analysis:", file=report)
+    for gender, count, rate in zip(genders, gender_counts, gender_rates * 100):
+        gender_name = 'Female' if gender == 'F' else 'Male'
+        print(f"   • {gender_name}: {count:,} appointments, {rate:.1f}% no-show rate", file=report)
     
     # Age group analysis
-    age_bins = [0, 18, 36, 56, 120]
+    # Find each age's group index by binary search over the inner bin edges; ages outside
+    # 0-119 do not belong to any group. Labels are only needed when printing.
+    age_bins = np.array([18, 36, 56], dtype=np.int16)
     age_labels = ['Children (0-17)', 'Young Adults (18-35)', 'Middle-aged (36-55)', 'Seniors (56+)']
-    df['AgeGroup'] = pd.cut(df['Age'], bins=age_bins, labels=age_labels, right=False)
+    ages = df['Age'].to_numpy(dtype=np.int16)
+    in_range = (ages >= 0) & (ages < 120)
+    age_codes = np.searchsorted(age_bins, ages[in_range], side='right')
+    age_counts = np.bincount(age_codes, minlength=len(age_labels))
+    age_rates = np.bincount(age_codes, weights=no_shows[in_range], minlength=len(age_labels)) / age_counts
     
-    age_stats = df.groupby('AgeGroup')['NoShow_Binary'].agg(['count', 'mean']).round(3)
-    print(f"\n🎂 Age Group Analysis:")
-    for age_group in age_labels:
-        if age_group in age_stats.index:
-            count = age_stats.loc[age_group, 'count']
-            rate = age_stats.loc[age_group, 'mean'] * 100
-            print(f"   • {age_group}: {count:,} appointments, {rate:.1f}% no-show rate")
+    print(f"\n🎂 Age Group Analysis:", file=report)
+    for age_group, count, rate in zip(age_labels, age_counts, age_rates * 100):
+        print(f"   • {age_group}: {count:,} appointments, {rate:.1f}% no-show rate", file=report)
     
-    # Medical conditions impact
+    # Medical conditions, SMS, Scholarship and same-day impact
     conditions = ['Hipertension', 'Diabetes', 'Alcoholism']
-    print(f"\n🏥 Medical Conditions Impact:")
-    for condition in conditions:
-        with_condition = df[df[condition] == 1]['NoShow_Binary'].mean() * 100
-        without_condition = df[df[condition] == 0]['NoShow_Binary'].mean() * 100
-        total_with = df[condition].sum()
-        print(f"   • {condition}:")
-        print(f"     - With condition: {with_condition:.1f}% no-show ({total_with:,} patients)")
-        print(f"     - Without condition: {without_condition:.1f}% no-show")
-    
-    # SMS and Scholarship impact
-    sms_impact = df.groupby('SMS_received')['NoShow_Binary'].mean() * 100
-    scholarship_impact = df.groupby('Scholarship')['NoShow_Binary'].mean() * 100
-    
-    print(f"\n📱 SMS and Support Impact:")
-    print(f"   • SMS Reminder:")
-    print(f"     - No SMS: {sms_impact[0]:.1f}% no-show")
-    print(f"     - With SMS: {sms_impact[1]:.1f}% no-show")
-    print(f"   • Scholarship (Financial Support):")
-    print(f"     - No scholarship: {scholarship_impact[0]:.1f}% no-show")
-    print(f"     - With scholarship: {scholarship_impact[1]:.1f}% no-show")
+    # All of these are 0/1 flags, so one matrix-vector product gives the no-shows among
+    # appointments with each flag, and the rest of the no-shows belong to those without it.
+    # Same-day appointments are added as one more flag column, so a single pass over the
+    # flag matrix covers every split.
+    flag_columns = conditions + ['SMS_received', 'Scholarship', 'SameDay']
+    flags = np.column_stack((df[flag_columns[:-1]].to_numpy(), days_waiting == 0))
+    totals_with = flags.sum(axis=0)
+    no_shows_with = flags.T @ no_shows
+    flag_rates = dict(zip(flag_columns, zip(
+        (no_shows.sum() - no_shows_with) / (n - totals_with) * 100,
+        no_shows_with / totals_with * 100
+    )))
+    
+    print(f"\n🏥 Medical Conditions Impact:", file=report)
+    for condition, total_with in zip(conditions, totals_with):
+        without_condition, with_condition = flag_rates[condition]
+        print(f"   • {condition}:", file=report)
+        print(f"     - With condition: {with_condition:.1f}% no-show ({total_with:,} patients)", file=report)
+        print(f"     - Without condition: {without_condition:.1f}% no-show", file=report)
+    
+    sms_impact = flag_rates['SMS_received']
+    scholarship_impact = flag_rates['Scholarship']
+    
+    print(f"\n📱 SMS and Support Impact:", file=report)
+    print(f"   • SMS Reminder:", file=report)
+    print(f"     - No SMS: {sms_impact[0]:.1f}% no-show", file=report)
+    print(f"     - With SMS: {sms_impact[1]:.1f}% no-show", file=report)
+    print(f"   • Scholarship (Financial Support):", file=report)
+    print(f"     - No scholarship: {scholarship_impact[0]:.1f}% no-show", file=report)
+    print(f"     - With scholarship: {scholarship_impact[1]:.1f}% no-show", file=report)
     
     # Waiting time analysis
-    same_day = df[df['DaysWaiting'] == 0]
-    same_day_no_show = (same_day['NoShow_Binary'].sum() / len(same_day)) * 100
-    
-    print(f"\n⏰ Waiting Time Insights:")
-    print(f"   • Same-day appointments: {len(same_day):,} ({len(same_day)/len(df)*100:.1f}%)")
-    print(f"   • Same-day no-show rate: {same_day_no_show:.1f}%")
-    print(f"   • Maximum waiting time: {df['DaysWaiting'].max()} days")
-    print(f"   • Median waiting time: {df['DaysWaiting'].median()} days")
+    same_day_count = totals_with[flag_columns.index('SameDay')]
+    same_day_no_show = flag_rates['SameDay'][1]
+    # Partition around the middle element(s) instead of fully sorting for the median
+    middle = [(n - 1) // 2, n // 2]
+    median_waiting = np.partition(days_waiting, middle)[middle].mean()
+    
+    print(f"\n⏰ Waiting Time Insights:", file=report)
+    print(f"   • Same-day appointments: {same_day_count:,} ({same_day_count/n*100:.1f}%)", file=report)
+    print(f"   • Same-day no-show rate: {same_day_no_show:.1f}%", file=report)
+    print(f"   • Maximum waiting time: {days_waiting.max()} days", file=report)
+    print(f"   • Median waiting time: {median_waiting} days", file=report)
     
     # Top neighborhoods with highest no-show rates
-    neighborhood_stats = df.groupby('Neighbourhood').agg({
-        'NoShow_Binary': ['count', 'mean']
-    }).round(3)
-    neighborhood_stats.columns = ['total_appointments', 'no_show_rate']
-    neighborhood_stats = neighborhood_stats[neighborhood_stats['total_appointments'] >= 100]  # Filter for significant volume
-    top_no_show_neighborhoods = neighborhood_stats.nlargest(5, 'no_show_rate')
-    
-    print(f"\n🏘️  Top 5 Neighborhoods with Highest No-Show Rates (min 100 appointments):")
-    for i, (neighborhood, stats) in enumerate(top_no_show_neighborhoods.iterrows(), 1):
-        print(f"   {i}. {neighborhood}: {stats['no_show_rate']*100:.1f}% ({stats['total_appointments']:.0f} appointments)")
-    
-    print(f"\n🚀 To explore these insights interactively, run:")
-    print(f"   python3 app.py")
-    print(f"   Then open: http://localhost:8050")
-    print("=" * 60)
+    neighborhoods, neighborhood_counts, neighborhood_rates = group_no_show_rates(df['Neighbourhood'], no_shows)
+    # Rank only the neighborhoods with significant volume. np.partition finds the k-th highest
+    # rate in linear time; every rate above it is kept, and ties at the cut-off are filled in
+    # alphabetical order like nlargest does. Only the k kept neighborhoods are sorted.
+    ranked_rates = np.where(neighborhood_counts >= 100, neighborhood_rates, -1)
+    k = min(5, int((neighborhood_counts >= 100).sum()))
+    if k > 0:
+        cutoff = np.partition(ranked_rates, -k)[-k]
+        above = np.flatnonzero(ranked_rates > cutoff)
+        ties = np.flatnonzero(ranked_rates == cutoff)[:k - len(above)]
+        top = np.concatenate((above, ties))
+        top = top[np.lexsort((top, -ranked_rates[top]))]
+    else:
+        top = np.array([], dtype=np.intp)
+    
+    print(f"\n🏘️  Top 5 Neighborhoods with Highest No-Show Rates (min 100 appointments):", file=report)
+    for i, (neighborhood, rate, count) in enumerate(zip(neighborhoods[top], neighborhood_rates[top], neighborhood_counts[top]), 1):
+        print(f"   {i}. {neighborhood}: {rate*100:.1f}% ({count:.0f} appointments)", file=report)
+    
+    print(f"\n🚀 To explore these insights interactively, run:", file=report)
+    print(f"   python3 app.py", file=report)
+    print(f"   Then open: http://localhost:8050", file=report)
+    print("=" * 60, file=report)
+    sys.stdout.write(report.getvalue())
 
 if __name__ == "__main__":
     try: